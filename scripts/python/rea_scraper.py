@@ -7,18 +7,31 @@ This script is called by the Go scraper and outputs JSON to stdout.
 Usage:
     python rea_scraper.py --url "https://www.realestate.com.au/buy/..." --output json
     python rea_scraper.py --pages 5 --region nsw
+    python rea_scraper.py --pages 5 --region nsw --concurrent
+    python rea_scraper.py --pages 5 --region nsw --http
 
 Requirements:
     pip install undetected-chromedriver selenium
+    pip install aiohttp  # optional, for --http
+    pip install orjson   # optional, faster JSON parsing
+    pip install lxml     # optional, faster HTML link fallback
 """
 
 import argparse
+import asyncio
+import base64
+import fcntl
 import json
+import os
 import sys
+import threading
 import time
 import re
 import random
-from typing import List, Dict, Any, Optional
+from collections import deque
+from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 
 try:
     from selenium import webdriver
@@ -52,9 +65,86 @@ except ImportError as e:
     }))
     sys.exit(1)
 
+# Optional fast path: fetch list pages over plain HTTP once the browser has passed Kasada
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+# Optional faster JSON parser for the large embedded page payloads
+try:
+    import orjson
+    HAS_ORJSON = True
+    _loads = orjson.loads
+except ImportError:
+    HAS_ORJSON = False
+    _loads = json.loads
+
+# Optional C HTML parser for the link fallback
+try:
+    import lxml.html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+
+# Persistent browser profiles, so the HTTP cache and Kasada clearance cookies
+# survive between runs. Chrome refuses to share a profile, so each driver locks one.
+PROFILE_ROOT = os.path.join(os.path.expanduser('~'), '.cache', 'rea-scraper')
+MAX_PROFILES = 8
+
+# Profile lock files held by live drivers, keyed by id(driver)
+_profile_locks: Dict[int, Any] = {}
+
+
+def acquire_profile():
+    """Lock the first free profile directory, returning (path, lock file) or (None, None)."""
+    os.makedirs(PROFILE_ROOT, exist_ok=True)
+    for index in range(MAX_PROFILES):
+        lock_file = open(os.path.join(PROFILE_ROOT, f'profile-{index}.lock'), 'w')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            continue
+        profile_dir = os.path.join(PROFILE_ROOT, f'profile-{index}')
+        os.makedirs(profile_dir, exist_ok=True)
+        return profile_dir, lock_file
+    return None, None
+
 
 def create_driver(headless: bool = True):
-    """Create a Chrome driver instance, trying undetected-chromedriver first."""
+    """Create a Chrome driver on a persistent profile, trying undetected-chromedriver first."""
+    profile_dir, lock_file = acquire_profile()
+    if profile_dir is None:
+        print("No free browser profile, using a temporary one", file=sys.stderr)
+    
+    try:
+        driver = _create_driver(headless, profile_dir)
+    except Exception:
+        if lock_file:
+            lock_file.close()
+        raise
+    
+    if lock_file:
+        _profile_locks[id(driver)] = lock_file
+    return driver
+
+
+def quit_driver(driver):
+    """Quit a driver and release its profile lock."""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    lock_file = _profile_locks.pop(id(driver), None)
+    if lock_file:
+        lock_file.close()
+
+
+def _create_driver(headless: bool, profile_dir: Optional[str]):
+    """Launch Chrome, trying undetected-chromedriver first."""
     
     # Common Chrome options for stealth
     chrome_options = [
@@ -65,19 +155,34 @@ def create_driver(headless: bool = True):
         '--window-size=1920,1080',
         '--lang=en-AU',
         '--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
+        # Trim processes and memory; --single-process is left out as it destabilises Kasada
+        '--no-zygote',
+        '--disable-gpu',
+        '--disable-extensions',
+        '--disable-sync',
+        '--disable-default-apps',
+        '--disable-features=Translate,BackForwardCache,AcceptCHFrame,MediaRouter',
+        '--mute-audio',
+        '--metrics-recording-only',
     ]
     
     if headless:
         chrome_options.append('--headless=new')
     
+    if profile_dir:
+        chrome_options.append(f'--user-data-dir={profile_dir}')
+        chrome_options.append(f'--disk-cache-dir={profile_dir}/cache')
+        chrome_options.append('--disk-cache-size=134217728')
+    
     # Try undetected_chromedriver first (best for bypassing Kasada)
     if HAS_UC:
         try:
             options = uc.ChromeOptions()
             for opt in chrome_options:
                 options.add_argument(opt)
+            options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+            options.page_load_strategy = 'eager'
             
-            import os
             home = os.path.expanduser('~')
             driver = uc.Chrome(
                 options=options, 
@@ -86,6 +191,7 @@ def create_driver(headless: bool = True):
                 driver_executable_path=os.path.join(home, 'chromedriver'),
             )
             driver.set_page_load_timeout(60)
+            prepare_window(driver)
             print("Using undetected_chromedriver", file=sys.stderr)
             return driver
         except Exception as e:
@@ -96,6 +202,8 @@ def create_driver(headless: bool = True):
     options = Options()
     for opt in chrome_options:
         options.add_argument(opt)
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    options.page_load_strategy = 'eager'
     
     # Stealth settings
     options.add_experimental_option('excludeSwitches', ['enable-automation'])
@@ -121,107 +229,268 @@ def create_driver(headless: bool = True):
         else:
             raise
     
-    # Execute stealth scripts
-    driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-        'source': '''
-            Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-            Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
-            Object.defineProperty(navigator, 'languages', {get: () => ['en-AU', 'en']});
-            window.chrome = {runtime: {}};
-        '''
-    })
-    
     driver.set_page_load_timeout(60)
+    prepare_window(driver)
     return driver
 
 
+# Stealth patches for plain Selenium; undetected_chromedriver applies its own
+STEALTH_SCRIPT = '''
+    Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+    Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
+    Object.defineProperty(navigator, 'languages', {get: () => ['en-AU', 'en']});
+    window.chrome = {runtime: {}};
+'''
+
+
+# Synthetic pointer activity injected before any page script runs, so Kasada
+# sees input from the start rather than only after a challenge appears
+INPUT_ENTROPY_SCRIPT = '''
+    (() => {
+        const point = () => ({
+            clientX: Math.random() * 800,
+            clientY: Math.random() * 600,
+            bubbles: true
+        });
+        setInterval(() => document.dispatchEvent(new MouseEvent('mousemove', point())), 500);
+        setTimeout(() => {
+            window.dispatchEvent(new Event('scroll'));
+            document.dispatchEvent(new PointerEvent('pointerdown', point()));
+        }, 200);
+    })();
+'''
+
+
+# Subresources the scraper never reads; JS stays enabled because Kasada needs it
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg',
+    '*.woff', '*.woff2', '*.ttf', '*.css', '*.mp4',
+    '*/analytics*', '*doubleclick*', '*googletagmanager*',
+]
+
+
+def prepare_window(driver):
+    """Register init scripts and resource blocking on the driver's current window.
+    
+    CDP settings are per target, so every new tab needs this before it navigates.
+    """
+    source = INPUT_ENTROPY_SCRIPT
+    if not (HAS_UC and isinstance(driver, uc.Chrome)):
+        source = STEALTH_SCRIPT + source
+    driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': source})
+    block_resources(driver)
+
+
+def block_resources(driver):
+    """Stop the browser downloading images, fonts, styles and trackers."""
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        print(f"Could not block resources: {e}", file=sys.stderr)
+
+
+# Seconds to wait for listing content after navigation
+PAGE_READY_TIMEOUT = 20
+
+# Seconds to wait for a Kasada challenge to resolve
+KASADA_TIMEOUT = 15
+
+# Seconds to wait for in-flight listings API requests after the page is interactive
+NETWORK_CAPTURE_TIMEOUT = 10
+
+
+# Kasada challenge pages are tiny; real pages also load the KPSDK script, so
+# only short pages that mention it count as a challenge
+KASADA_CHALLENGE_MAX_LENGTH = 5000
+
+
+def is_kasada_html(html: str) -> bool:
+    """Check whether page source is a Kasada challenge rather than a real page."""
+    return len(html) < KASADA_CHALLENGE_MAX_LENGTH and 'KPSDK' in html
+
+
+def is_kasada_challenge(driver) -> bool:
+    """Check whether the current page is a Kasada challenge.
+    
+    Only the document length crosses the wire for normal pages; the full
+    source is fetched only when the page is small enough to be a challenge.
+    """
+    length = driver.execute_script('return document.documentElement.outerHTML.length;')
+    if length >= KASADA_CHALLENGE_MAX_LENGTH:
+        return False
+    return is_kasada_html(driver.page_source)
+
+
+def kasada_cleared(driver) -> bool:
+    """Wait condition: true once the Kasada challenge page has been replaced."""
+    return not is_kasada_challenge(driver)
+
+
 def random_delay(min_sec: float = 1.0, max_sec: float = 3.0):
     """Add a random delay to appear more human."""
     time.sleep(random.uniform(min_sec, max_sec))
 
 
-def scroll_page(driver):
-    """Scroll the page to simulate human behavior and trigger lazy loading."""
-    try:
-        # Scroll down gradually
-        for i in range(3):
-            driver.execute_script(f"window.scrollTo(0, document.body.scrollHeight * {(i+1)/4});")
-            time.sleep(0.5 + random.random())
-        
-        # Scroll back to top
-        driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(0.5)
-    except Exception:
-        pass
+# Square metres per land size unit
+_LAND_UNITS = {
+    'hectares': 10000,
+    'hectare': 10000,
+    'ha': 10000,
+    'acres': 4046.86,
+    'acre': 4046.86,
+    'm²': 1,
+    'sqm': 1,
+    'm2': 1,
+}
+
+# Any one land size unit as a whole word, longest first so 'hectares' wins over 'ha'
+_LAND_UNIT_PATTERN = '(?:' + '|'.join(re.escape(unit) for unit in sorted(_LAND_UNITS, key=len, reverse=True)) + r')\b'
+
+# Patterns compiled once at import
+_ARGONAUT_RE = re.compile(r'window\.ArgonautExchange\s*=\s*(\{.+?\});?\s*</script>', re.DOTALL)
+_NEXT_DATA_RE = re.compile(r'<script[^>]*id="__NEXT_DATA__"[^>]*>(\{.+?\})</script>', re.DOTALL)
+_LAND_SIZE_RE = re.compile(r'([\d.]+)\s*(' + _LAND_UNIT_PATTERN + ')', re.IGNORECASE)
+_LAND_UNIT_RE = re.compile(_LAND_UNIT_PATTERN, re.IGNORECASE)
+_NUMBER_RE = re.compile(r'\d*\.?\d+')
+_PROPERTY_ID_RE = re.compile(r'-(\d{6,})$')
+_POSTCODE_RE = re.compile(r'^\d{4}$')
+_PROPERTY_HREF_RE = re.compile(r'<a\b[^>]*\bhref="([^"]*/property-[^"]*)"')
+_LISTINGS_API_RE = re.compile(r'^https://[\w.-]*realestate\.com\.au/(?:[^?#]*/)?listings(?:[/?#]|$)')
+_HAS_MORE_RE = re.compile(r'rel="next"|aria-label="Go to [Nn]ext [Pp]age"|data-testid="[^"]*next[^"]*"')
 
 
 def extract_json_data(html: str) -> Optional[Dict]:
     """Extract embedded JSON data from the page."""
-    patterns = [
-        r'window\.ArgonautExchange\s*=\s*(\{.+?\});?\s*</script>',
-        r'<script[^>]*id="__NEXT_DATA__"[^>]*>(\{.+?\})</script>',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, html, re.DOTALL)
+    for pattern in (_ARGONAUT_RE, _NEXT_DATA_RE):
+        match = pattern.search(html)
         if match:
             try:
-                return json.loads(match.group(1))
+                return _loads(match.group(1))
             except json.JSONDecodeError:
                 continue
     
     return None
 
 
+# Key paths to tieredResults in the page JSON
+_TIERED_RESULTS_PATHS = (
+    ('rpiResults', 'tieredResults'),
+    ('props', 'pageProps', 'rpiResults', 'tieredResults'),
+)
+
+# The path that matched last, tried first since pages share a schema. It is
+# only ever replaced whole, so threads reading it never see a partial update.
+_last_tiered_path = _TIERED_RESULTS_PATHS[0]
+
+
+def find_tiered_results(data: Dict) -> Optional[List]:
+    """Return the tieredResults list if the JSON has one at a known path."""
+    global _last_tiered_path
+    
+    last = _last_tiered_path
+    tiered = _g(data, *last)
+    if isinstance(tiered, list):
+        return tiered
+    
+    for path in _TIERED_RESULTS_PATHS:
+        if path == last:
+            continue
+        tiered = _g(data, *path)
+        if isinstance(tiered, list):
+            _last_tiered_path = path
+            return tiered
+    return None
+
+
+def json_has_more(data: Dict) -> Optional[bool]:
+    """Read whether more result pages follow from the pagination or total fields.
+    
+    These sit beside tieredResults. Returns None when the JSON has neither.
+    """
+    for path in _TIERED_RESULTS_PATHS:
+        root = _g(data, *path[:-1])
+        if not isinstance(root, dict):
+            continue
+        
+        more = _g(root, 'pagination', 'moreResultsAvailable')
+        if isinstance(more, bool):
+            return more
+        
+        page = _g(root, 'resolvedQuery', 'page')
+        max_page = _g(root, 'pagination', 'maxPageNumberAvailable')
+        if isinstance(page, int) and isinstance(max_page, int):
+            return page < max_page
+        
+        total = root.get('totalResultsCount')
+        page_size = _g(root, 'resolvedQuery', 'pageSize')
+        if isinstance(page, int) and isinstance(page_size, int) and isinstance(total, int):
+            return page * page_size < total
+    
+    return None
+
+
 def extract_listings_from_json(data: Dict) -> List[Dict]:
     """Extract listing data from the JSON structure."""
-    listings = []
+    tiered = find_tiered_results(data)
     
-    # Try rpiResults.tieredResults[].results[]
-    try:
-        rpi = data.get('rpiResults', {})
-        tiered = rpi.get('tieredResults', [])
-        for tier in tiered:
-            results = tier.get('results', [])
-            for r in results:
+    # Only search the whole structure when the known path is absent
+    if tiered is None:
+        return list(iter_listings(data))
+    
+    return listings_from_tiered(tiered)
+
+
+def listings_from_tiered(tiered: List) -> List[Dict]:
+    """Parse the listings in rpiResults.tieredResults[].results[]."""
+    listings = []
+    for tier in tiered:
+        for r in _g(tier, 'results', default=None) or []:
+            if isinstance(r, dict):
                 listing = parse_json_listing(r)
                 if listing:
                     listings.append(listing)
-    except (KeyError, TypeError):
-        pass
-    
-    # Try recursive search if no results
-    if not listings:
-        listings = find_listings_recursive(data)
     
     return listings
 
 
-def find_listings_recursive(data: Any, depth: int = 0) -> List[Dict]:
-    """Recursively search for listings in nested JSON."""
-    if depth > 10:
-        return []
-    
-    listings = []
+# Keys that never contain listings
+_SKIP_KEYS = frozenset({'tracking', 'analytics', 'meta'})
+
+
+def iter_listings(data: Any, max_depth: int = 10) -> Iterator[Dict]:
+    """Walk nested JSON depth-first and yield every listing found."""
+    stack = deque([(data, 0)])
     
-    if isinstance(data, dict):
-        # Check if this looks like a listing
-        if 'id' in data and ('prettyUrl' in data or '_links' in data):
-            listing = parse_json_listing(data)
-            if listing:
-                return [listing]
+    while stack:
+        node, depth = stack.pop()
+        if depth > max_depth:
+            continue
         
-        # Recurse into nested objects
-        for key, val in data.items():
-            if key in ('tracking', 'analytics', 'meta'):
-                continue
-            listings.extend(find_listings_recursive(val, depth + 1))
-    
-    elif isinstance(data, list):
-        for item in data:
-            listings.extend(find_listings_recursive(item, depth + 1))
-    
-    return listings
+        if isinstance(node, dict):
+            # Check if this looks like a listing
+            if 'id' in node and ('prettyUrl' in node or '_links' in node):
+                listing = parse_json_listing(node)
+                if listing:
+                    yield listing
+                    continue
+            
+            # Push children in reverse so they are visited in document order
+            children = [val for key, val in node.items() if key not in _SKIP_KEYS]
+            stack.extend((val, depth + 1) for val in reversed(children))
+        
+        elif isinstance(node, list):
+            stack.extend((item, depth + 1) for item in reversed(node))
+
+
+def _g(d: Any, *path, default: Any = None) -> Any:
+    """Follow a path of keys/indexes into nested JSON, returning default if any step is missing."""
+    for key in path:
+        try:
+            d = d[key]
+        except (KeyError, IndexError, TypeError):
+            return default
+    return d
 
 
 def parse_json_listing(data: Dict) -> Optional[Dict]:
@@ -242,51 +511,38 @@ def parse_json_listing(data: Dict) -> Optional[Dict]:
             url = 'https://www.realestate.com.au' + url
         listing['url'] = url
     elif '_links' in data:
-        try:
-            listing['url'] = data['_links']['canonical']['href']
-        except (KeyError, TypeError):
-            pass
+        href = _g(data, '_links', 'canonical', 'href')
+        if href is not None:
+            listing['url'] = href
     
     # Extract address
-    addr = data.get('address', {})
-    if isinstance(addr, dict):
-        display = addr.get('display', {})
-        if isinstance(display, dict):
-            listing['address'] = display.get('shortAddress') or display.get('fullAddress')
-        listing['suburb'] = addr.get('suburb')
-        listing['postcode'] = addr.get('postcode')
-        listing['state'] = addr.get('state', 'NSW')
-        
-        # Coordinates
-        location = addr.get('location', {})
-        if isinstance(location, dict):
-            if 'latitude' in location:
-                listing['latitude'] = float(location['latitude'])
-            if 'longitude' in location:
-                listing['longitude'] = float(location['longitude'])
+    listing['address'] = (_g(data, 'address', 'display', 'shortAddress') or
+                          _g(data, 'address', 'display', 'fullAddress'))
+    listing['suburb'] = _g(data, 'address', 'suburb')
+    listing['postcode'] = _g(data, 'address', 'postcode')
+    listing['state'] = _g(data, 'address', 'state', default='NSW')
+    
+    # Coordinates
+    latitude = _g(data, 'address', 'location', 'latitude')
+    if latitude is not None:
+        listing['latitude'] = float(latitude)
+    longitude = _g(data, 'address', 'location', 'longitude')
+    if longitude is not None:
+        listing['longitude'] = float(longitude)
     
     # Extract price
-    price = data.get('price', {})
-    if isinstance(price, dict):
-        listing['price_text'] = price.get('display')
+    listing['price_text'] = _g(data, 'price', 'display')
     
     # Extract features
-    features = data.get('generalFeatures', {})
-    if isinstance(features, dict):
-        beds = features.get('bedrooms', {})
-        if isinstance(beds, dict) and 'value' in beds:
-            listing['bedrooms'] = int(beds['value'])
-        baths = features.get('bathrooms', {})
-        if isinstance(baths, dict) and 'value' in baths:
-            listing['bathrooms'] = int(baths['value'])
+    bedrooms = _g(data, 'generalFeatures', 'bedrooms', 'value')
+    if bedrooms is not None:
+        listing['bedrooms'] = int(bedrooms)
+    bathrooms = _g(data, 'generalFeatures', 'bathrooms', 'value')
+    if bathrooms is not None:
+        listing['bathrooms'] = int(bathrooms)
     
     # Extract land size
-    sizes = data.get('propertySizes', {})
-    if isinstance(sizes, dict):
-        land = sizes.get('land', {})
-        if isinstance(land, dict):
-            display_val = land.get('displayValue', '')
-            listing['land_size_sqm'] = parse_land_size(display_val)
+    listing['land_size_sqm'] = parse_land_size(_g(data, 'propertySizes', 'land', 'displayValue'))
     
     # Extract property type
     listing['property_type'] = data.get('propertyType', 'rural')
@@ -312,40 +568,124 @@ def parse_land_size(size_str: str) -> Optional[float]:
     if not size_str:
         return None
     
-    size_str = size_str.lower().replace(',', '')
+    size_str = size_str.replace(',', '')
     
-    match = re.search(r'([\d.]+)', size_str)
-    if not match:
+    # A number directly followed by its unit, e.g. "40 ha" in "Lot 3 - 40 ha"
+    match = _LAND_SIZE_RE.search(size_str)
+    if match:
+        try:
+            return float(match.group(1)) * _LAND_UNITS[match.group(2).lower()]
+        except ValueError:
+            pass
+    
+    # Otherwise the first number, scaled by a unit anywhere in the text
+    number = _NUMBER_RE.search(size_str)
+    if not number:
         return None
+    unit = _LAND_UNIT_RE.search(size_str)
+    return float(number.group()) * (_LAND_UNITS[unit.group().lower()] if unit else 1)
+
+
+def read_network_events(driver) -> List[Dict]:
+    """Drain the browser's performance log and return the CDP events in it."""
+    try:
+        entries = driver.get_log('performance')
+    except Exception:
+        return []
+    
+    events = []
+    for entry in entries:
+        try:
+            events.append(_loads(entry['message'])['message'])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return events
+
+
+def extract_listings_from_network(driver) -> Tuple[List[Dict], Optional[bool]]:
+    """Extract listings from the page's own listings API responses.
     
-    value = float(match.group(1))
+    With the eager page load strategy the page may still be fetching when this
+    runs, so network events are read until every listings API request seen so
+    far has finished or failed, up to NETWORK_CAPTURE_TIMEOUT. Only bodies
+    whose loading finished are read, and only responses that carry
+    tieredResults are trusted.
     
-    if 'hectare' in size_str or 'ha' in size_str:
-        return value * 10000
-    elif 'acre' in size_str:
-        return value * 4046.86
-    elif 'm²' in size_str or 'sqm' in size_str or 'm2' in size_str:
-        return value
+    Also returns has_more as read from the responses' pagination fields, or
+    None if they had none.
+    """
+    pending = set()
+    json_responses = set()
+    finished = []
+    deadline = time.monotonic() + NETWORK_CAPTURE_TIMEOUT
+    
+    while True:
+        for event in read_network_events(driver):
+            method = event.get('method')
+            params = event.get('params', {})
+            request_id = params.get('requestId')
+            
+            if method == 'Network.requestWillBeSent':
+                if _LISTINGS_API_RE.match(_g(params, 'request', 'url', default='')):
+                    pending.add(request_id)
+            elif request_id not in pending:
+                continue
+            elif method == 'Network.responseReceived':
+                if 'json' in _g(params, 'response', 'mimeType', default=''):
+                    json_responses.add(request_id)
+            elif method == 'Network.loadingFinished':
+                pending.discard(request_id)
+                finished.append(request_id)
+            elif method == 'Network.loadingFailed':
+                pending.discard(request_id)
+        
+        if not pending or time.monotonic() >= deadline:
+            break
+        time.sleep(0.25)
+    
+    listings = []
+    has_more = None
+    for request_id in finished:
+        if request_id not in json_responses:
+            continue
+        
+        try:
+            body = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+            raw = base64.b64decode(body['body']) if body.get('base64Encoded') else body['body']
+            data = _loads(raw)
+        except Exception:
+            continue
+        
+        tiered = find_tiered_results(data) if isinstance(data, dict) else None
+        if tiered is not None:
+            listings.extend(listings_from_tiered(tiered))
+            if has_more is None:
+                has_more = json_has_more(data)
     
-    return value
+    return listings, has_more
+
+
+def property_links(html: str) -> List[str]:
+    """Return the absolute href of every property link in the page source."""
+    if HAS_LXML:
+        hrefs = lxml.html.fromstring(html).xpath("//a[contains(@href,'/property-')]/@href")
+    else:
+        hrefs = _PROPERTY_HREF_RE.findall(html)
+    return [urljoin('https://www.realestate.com.au/', href) for href in hrefs]
 
 
-def extract_listings_from_html(driver) -> List[Dict]:
+def extract_listings_from_html(html: str) -> List[Dict]:
     """Extract listings from HTML when JSON is not available."""
     listings = []
     seen_ids = set()
     
     try:
-        # Find all property links
-        links = driver.find_elements(By.CSS_SELECTOR, 'a[href*="/property-"]')
-        
-        for link in links:
-            href = link.get_attribute('href')
+        for href in property_links(html):
             if not href:
                 continue
             
             # Extract listing ID from URL
-            match = re.search(r'-(\d{6,})$', href)
+            match = _PROPERTY_ID_RE.search(href)
             if not match:
                 continue
             
@@ -367,7 +707,7 @@ def extract_listings_from_html(driver) -> List[Dict]:
             if len(parts) >= 4:
                 # Try to find postcode (4 digits before ID)
                 for i, part in enumerate(parts[:-1]):
-                    if re.match(r'^\d{4}$', part):
+                    if _POSTCODE_RE.match(part):
                         listing['postcode'] = part
                         if i > 0:
                             listing['suburb'] = parts[i-1].replace('+', ' ').title()
@@ -381,8 +721,23 @@ def extract_listings_from_html(driver) -> List[Dict]:
     return listings
 
 
-def scrape_page(driver, url: str) -> Dict[str, Any]:
-    """Scrape a single page and return results."""
+# Next-page links of the list page pager, matching _HAS_MORE_RE
+PAGER_SELECTOR = 'a[rel="next"], [aria-label="Go to next page" i], [data-testid*="next"]'
+
+
+def has_next_page(html: str) -> bool:
+    """Check whether a list page links to a following page."""
+    return _HAS_MORE_RE.search(html) is not None
+
+
+def load_page(driver, url: str, navigate: bool = True) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Load a page in the browser and capture everything needed to parse it.
+    
+    Returns the partial result (with listings already filled in if the page's
+    own JSON API responses were captured) and the page source. Parsing them
+    with parse_page needs no further browser access. The source is None when
+    the API responses also gave has_more, as nothing is left to read from it.
+    """
     result = {
         'url': url,
         'listings': [],
@@ -391,62 +746,102 @@ def scrape_page(driver, url: str) -> Dict[str, Any]:
     }
     
     try:
-        driver.get(url)
-        random_delay(2, 4)
+        if navigate:
+            # Discard network events left over from the previous page
+            read_network_events(driver)
+            driver.get(url)
         
         # Check for Kasada challenge
-        page_source = driver.page_source
-        if 'KPSDK' in page_source and len(page_source) < 5000:
-            # Wait longer for challenge to resolve
+        if is_kasada_challenge(driver):
+            # Wait for challenge to resolve
             print("Detected Kasada challenge, waiting...", file=sys.stderr)
-            time.sleep(10)
+            random_delay(1, 2)
             
-            # Simulate some mouse movement
-            driver.execute_script("""
-                document.dispatchEvent(new MouseEvent('mousemove', {
-                    clientX: 100 + Math.random() * 400,
-                    clientY: 100 + Math.random() * 300
-                }));
-            """)
-            
-            time.sleep(5)
-            page_source = driver.page_source
-            
-            if 'KPSDK' in page_source and len(page_source) < 5000:
+            try:
+                WebDriverWait(driver, KASADA_TIMEOUT, poll_frequency=0.5).until(kasada_cleared)
+            except TimeoutException:
                 result['error'] = 'Blocked by Kasada bot protection'
-                return result
+                return result, None
+        
+        # Network events are shared by every tab of the driver, so only
+        # trust them when this call did the navigation
+        has_more = None
+        if navigate:
+            result['listings'], has_more = extract_listings_from_network(driver)
         
-        # Scroll to load lazy content
-        scroll_page(driver)
-        random_delay(1, 2)
+        if result['listings'] and has_more is not None:
+            result['has_more'] = has_more
+            return result, None
         
-        # Get updated page source
+        # Wait until listing links or the pager are present; listing data
+        # embedded in the page is enough when there are no listings yet
+        conditions = [
+            EC.presence_of_element_located((By.CSS_SELECTOR, 'a[href*="/property-"]')),
+            EC.presence_of_element_located((By.CSS_SELECTOR, PAGER_SELECTOR)),
+        ]
+        if not result['listings']:
+            conditions.append(EC.presence_of_element_located((By.CSS_SELECTOR, 'script#__NEXT_DATA__')))
+        try:
+            WebDriverWait(driver, PAGE_READY_TIMEOUT, poll_frequency=0.25).until(EC.any_of(*conditions))
+        except TimeoutException:
+            print("Timed out waiting for listings, continuing with current page", file=sys.stderr)
+        
+        # Fetch the page source once and reuse it for all extraction
         page_source = driver.page_source
         
-        # Try to extract from JSON first
-        json_data = extract_json_data(page_source)
-        if json_data:
-            result['listings'] = extract_listings_from_json(json_data)
+    except TimeoutException:
+        result['error'] = 'Page load timeout'
+        return result, None
+    except Exception as e:
+        result['error'] = str(e)
+        return result, None
+    
+    return result, page_source
+
+
+def parse_page(result: Dict[str, Any], page_source: Optional[str]) -> Dict[str, Any]:
+    """Finish a result from load_page by extracting listings from the captured page."""
+    if result['error']:
+        return result
+    
+    try:
+        # Try to extract from embedded JSON next
+        if not result['listings']:
+            json_data = extract_json_data(page_source)
+            if json_data:
+                result['listings'] = extract_listings_from_json(json_data)
         
         # Fall back to HTML extraction
         if not result['listings']:
-            result['listings'] = extract_listings_from_html(driver)
+            result['listings'] = extract_listings_from_html(page_source)
         
-        # Check for next page
-        result['has_more'] = bool(
-            re.search(r'rel="next"', page_source) or
-            re.search(r'aria-label="Go to [Nn]ext [Pp]age"', page_source) or
-            re.search(r'data-testid="[^"]*next[^"]*"', page_source)
-        )
+        # Check for next page, unless the API responses already said
+        if page_source is not None:
+            result['has_more'] = has_next_page(page_source)
         
-    except TimeoutException:
-        result['error'] = 'Page load timeout'
     except Exception as e:
         result['error'] = str(e)
     
     return result
 
 
+def scrape_page(driver, url: str, navigate: bool = True) -> Dict[str, Any]:
+    """Scrape a single page and return results.
+    
+    With navigate=False the page is assumed to already be loading in the
+    driver's current window (e.g. a tab opened by scrape_rea_concurrent).
+    
+    Listings are taken from the page's own JSON API responses when it made
+    any; otherwise from the embedded page JSON, then from the HTML links.
+    """
+    return parse_page(*load_page(driver, url, navigate=navigate))
+
+
+def search_url(region: str, page_num: int) -> str:
+    """Build the REA list URL for a region and page number."""
+    return f"https://www.realestate.com.au/buy/property-land-acreage-rural-size-100000-in-{region}/list-{page_num}?activeSort=list-date"
+
+
 def scrape_rea(region: str = 'nsw', max_pages: int = 5, headless: bool = True) -> Dict[str, Any]:
     """Scrape REA listings for a region."""
     results = {
@@ -455,56 +850,284 @@ def scrape_rea(region: str = 'nsw', max_pages: int = 5, headless: bool = True) -
         'errors': []
     }
     
-    driver = None
+    # Listings keyed by external_id; the first occurrence wins
+    accum: Dict[str, Dict] = {}
+    
     try:
         print(f"Starting undetected Chrome (headless={headless})...", file=sys.stderr)
         driver = create_driver(headless=headless)
         
-        seen_ids = set()
+        # Set when the loop ends, so a pending prefetch skips its page load
+        stop = threading.Event()
         
-        for page_num in range(1, max_pages + 1):
-            url = f"https://www.realestate.com.au/buy/property-land-acreage-rural-size-100000-in-{region}/list-{page_num}?activeSort=list-date"
-            
+        def prefetch(page_num: int, url: str):
+            # Random delay between pages, cut short if scraping has finished
+            if stop.wait(random.uniform(3, 6)):
+                return None
             print(f"Scraping page {page_num}: {url}", file=sys.stderr)
+            return load_page(driver, url)
+        
+        prefetcher = ThreadPoolExecutor(max_workers=1)
+        try:
+            url = search_url(region, 1)
+            print(f"Scraping page 1: {url}", file=sys.stderr)
+            loading = prefetcher.submit(load_page, driver, url)
             
-            page_result = scrape_page(driver, url)
-            
-            if page_result['error']:
-                results['errors'].append(f"Page {page_num}: {page_result['error']}")
-                if 'Kasada' in page_result['error']:
+            for page_num in range(1, max_pages + 1):
+                loaded = loading.result()
+                
+                # Load the next page in the background while this one is parsed
+                if page_num < max_pages and 'Kasada' not in (loaded[0]['error'] or ''):
+                    loading = prefetcher.submit(prefetch, page_num + 1, search_url(region, page_num + 1))
+                
+                page_result = parse_page(*loaded)
+                
+                if page_result['error']:
+                    results['errors'].append(f"Page {page_num}: {page_result['error']}")
+                    if 'Kasada' in page_result['error']:
+                        break
+                    continue
+                
+                # Deduplicate
+                for listing in page_result['listings']:
+                    lid = listing.get('external_id')
+                    if lid:
+                        accum.setdefault(lid, listing)
+                
+                results['pages_scraped'] = page_num
+                print(f"Found {len(page_result['listings'])} listings on page {page_num}", file=sys.stderr)
+                
+                if not page_result['has_more']:
+                    print("No more pages", file=sys.stderr)
                     break
-                continue
-            
-            # Deduplicate
-            for listing in page_result['listings']:
-                lid = listing.get('external_id')
-                if lid and lid not in seen_ids:
-                    seen_ids.add(lid)
-                    results['listings'].append(listing)
+        
+        finally:
+            stop.set()
+            prefetcher.shutdown(wait=True)
+            quit_driver(driver)
+        
+    except Exception as e:
+        results['errors'].append(str(e))
+    
+    results['listings'] = list(accum.values())
+    return results
+
+
+def scrape_rea_concurrent(region: str = 'nsw', max_pages: int = 5, headless: bool = True) -> Dict[str, Any]:
+    """Scrape REA list pages concurrently as tabs of a single browser.
+    
+    Every page starts loading in its own tab before any is read, so the
+    browser fetches them in parallel; the tabs are then extracted in order.
+    """
+    results = {
+        'listings': [],
+        'pages_scraped': 0,
+        'errors': []
+    }
+    
+    # Listings keyed by external_id; the first occurrence wins
+    accum: Dict[str, Dict] = {}
+    
+    try:
+        print(f"Starting undetected Chrome (headless={headless})...", file=sys.stderr)
+        driver = create_driver(headless=headless)
+        try:
+            tabs = []
+            for page_num in range(1, max_pages + 1):
+                url = search_url(region, page_num)
+                print(f"Opening tab: {url}", file=sys.stderr)
+                driver.switch_to.new_window('tab')
+                prepare_window(driver)
+                # Start navigation without waiting for the page to load
+                driver.execute_script("window.location.href = arguments[0];", url)
+                tabs.append((driver.current_window_handle, url))
             
-            results['pages_scraped'] = page_num
-            print(f"Found {len(page_result['listings'])} listings on page {page_num}", file=sys.stderr)
+            for page_num, (handle, url) in enumerate(tabs, start=1):
+                driver.switch_to.window(handle)
+                page_result = scrape_page(driver, url, navigate=False)
+                
+                if page_result['error']:
+                    results['errors'].append(f"Page {page_num}: {page_result['error']}")
+                    if 'Kasada' in page_result['error']:
+                        break
+                    continue
+                
+                for listing in page_result['listings']:
+                    lid = listing.get('external_id')
+                    if lid:
+                        accum.setdefault(lid, listing)
+                
+                results['pages_scraped'] = page_num
+                print(f"Found {len(page_result['listings'])} listings on page {page_num}", file=sys.stderr)
+                
+                if not page_result['has_more']:
+                    print("No more pages", file=sys.stderr)
+                    break
+        finally:
+            # Quitting closes every tab
+            quit_driver(driver)
+        
+    except Exception as e:
+        results['errors'].append(str(e))
+    
+    results['listings'] = list(accum.values())
+    return results
+
+
+# Headers sent with plain HTTP page fetches (User-Agent is copied from the browser)
+HTTP_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-AU,en;q=0.9',
+}
+
+# Maximum simultaneous HTTP connections for the fast path
+HTTP_CONNECTION_LIMIT = 8
+
+
+async def fetch(session, url: str) -> str:
+    """Fetch a page over HTTP, returning an empty string on failure."""
+    try:
+        async with session.get(url) as response:
+            if response.status != 200:
+                print(f"HTTP fetch got status {response.status} for {url}", file=sys.stderr)
+                return ''
+            return await response.text()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        print(f"HTTP fetch failed for {url}: {e}", file=sys.stderr)
+        return ''
+
+
+async def fetch_all(urls: List[str], cookies: Dict[str, str], user_agent: str) -> List[str]:
+    """Fetch several pages concurrently with the browser's cookies and user agent."""
+    headers = dict(HTTP_HEADERS, **{'User-Agent': user_agent})
+    connector = aiohttp.TCPConnector(limit=HTTP_CONNECTION_LIMIT, keepalive_timeout=30)
+    timeout = aiohttp.ClientTimeout(total=60)
+    async with aiohttp.ClientSession(connector=connector, headers=headers,
+                                     cookies=cookies, timeout=timeout) as session:
+        return await asyncio.gather(*[fetch(session, url) for url in urls])
+
+
+def parse_http_page(url: str, html: str) -> Optional[Dict[str, Any]]:
+    """Build a page result from HTML fetched over HTTP.
+    
+    Returns None when the page needs a browser retry: the fetch failed, it is
+    a Kasada challenge, or it has no listing data at all. Page JSON with
+    tieredResults but no results is a real, empty last page.
+    """
+    if not html or is_kasada_html(html):
+        return None
+    
+    json_data = extract_json_data(html)
+    tiered = find_tiered_results(json_data) if json_data else None
+    
+    if tiered is not None:
+        listings = listings_from_tiered(tiered)
+        has_more = json_has_more(json_data)
+        if has_more is None:
+            has_more = has_next_page(html)
+        # No results means this is the last page, whatever the pager says
+        has_more = has_more and bool(listings)
+    else:
+        listings = extract_listings_from_json(json_data) if json_data else []
+        if not listings:
+            listings = extract_listings_from_html(html)
+        if not listings:
+            return None
+        has_more = has_next_page(html)
+    
+    return {
+        'url': url,
+        'listings': listings,
+        'has_more': has_more,
+        'error': None
+    }
+
+
+def scrape_rea_http(region: str = 'nsw', max_pages: int = 5, headless: bool = True) -> Dict[str, Any]:
+    """Scrape REA listings, using the browser only to pass Kasada.
+    
+    The first page is loaded in the browser; its cookies are then reused to
+    fetch the remaining pages concurrently over plain HTTP. The pages are then
+    taken in order until one has no next page. Any page that comes back as a
+    Kasada challenge or without listing data is retried in the browser, until
+    a retry is itself blocked by Kasada.
+    """
+    if not HAS_AIOHTTP:
+        print("aiohttp not available, using the browser for every page", file=sys.stderr)
+        return scrape_rea(region=region, max_pages=max_pages, headless=headless)
+    
+    results = {
+        'listings': [],
+        'pages_scraped': 0,
+        'errors': []
+    }
+    
+    # Listings keyed by external_id; the first occurrence wins
+    accum: Dict[str, Dict] = {}
+    
+    try:
+        print(f"Starting undetected Chrome (headless={headless})...", file=sys.stderr)
+        driver = create_driver(headless=headless)
+        try:
+            page_result = scrape_page(driver, search_url(region, 1))
             
-            if not page_result['has_more']:
-                print("No more pages", file=sys.stderr)
-                break
+            # Page HTML fetched over HTTP, keyed by URL
+            pages: Dict[str, str] = {}
+            if not page_result['error'] and page_result['has_more'] and max_pages > 1:
+                cookies = {c['name']: c['value'] for c in driver.get_cookies()}
+                user_agent = driver.execute_script('return navigator.userAgent;')
+                urls = [search_url(region, page_num) for page_num in range(2, max_pages + 1)]
+                
+                print(f"Fetching {len(urls)} pages over HTTP...", file=sys.stderr)
+                pages = dict(zip(urls, asyncio.run(fetch_all(urls, cookies, user_agent))))
             
-            # Random delay between pages
-            random_delay(3, 6)
+            for page_num in range(1, max_pages + 1):
+                if page_num > 1:
+                    url = search_url(region, page_num)
+                    page_result = parse_http_page(url, pages.get(url, ''))
+                    if page_result is None:
+                        print(f"HTTP fetch gave no listings, retrying in browser: {url}", file=sys.stderr)
+                        random_delay(3, 6)
+                        page_result = scrape_page(driver, url)
+                
+                if page_result['error']:
+                    results['errors'].append(f"Page {page_num}: {page_result['error']}")
+                    if 'Kasada' in page_result['error']:
+                        break
+                    continue
+                
+                for listing in page_result['listings']:
+                    lid = listing.get('external_id')
+                    if lid:
+                        accum.setdefault(lid, listing)
+                
+                results['pages_scraped'] = page_num
+                print(f"Found {len(page_result['listings'])} listings on page {page_num}", file=sys.stderr)
+                
+                if not page_result['has_more']:
+                    print("No more pages", file=sys.stderr)
+                    break
+        finally:
+            quit_driver(driver)
         
     except Exception as e:
         results['errors'].append(str(e))
     
-    finally:
-        if driver:
-            try:
-                driver.quit()
-            except Exception:
-                pass
-    
+    results['listings'] = list(accum.values())
     return results
 
 
+def write_result(result: Dict[str, Any]):
+    """Write a result to stdout: pretty for a terminal, compact JSON for the caller's pipe."""
+    if sys.stdout.isatty():
+        print(json.dumps(result, indent=2))
+    elif HAS_ORJSON:
+        sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_APPEND_NEWLINE))
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(result, separators=(',', ':')))
+
+
 def main():
     parser = argparse.ArgumentParser(description='Scrape REA listings using undetected-chromedriver')
     parser.add_argument('--url', help='Single URL to scrape')
@@ -512,6 +1135,8 @@ def main():
     parser.add_argument('--pages', type=int, default=5, help='Max pages to scrape (default: 5)')
     parser.add_argument('--headless', type=bool, default=True, help='Run in headless mode (default: true)')
     parser.add_argument('--no-headless', action='store_true', help='Run with visible browser')
+    parser.add_argument('--concurrent', action='store_true', help='Load all pages at once in separate tabs')
+    parser.add_argument('--http', action='store_true', help='Fetch pages after the first over plain HTTP (requires aiohttp)')
     
     args = parser.parse_args()
     
@@ -519,22 +1144,27 @@ def main():
     
     if args.url:
         # Single URL mode
-        driver = None
+        print(f"Starting undetected Chrome (headless={headless})...", file=sys.stderr)
+        driver = create_driver(headless=headless)
         try:
-            driver = create_driver(headless=headless)
             result = scrape_page(driver, args.url)
-            print(json.dumps(result, indent=2))
         finally:
-            if driver:
-                driver.quit()
+            quit_driver(driver)
+        write_result(result)
     else:
         # Multi-page mode
-        result = scrape_rea(
+        if args.http:
+            scrape = scrape_rea_http
+        elif args.concurrent:
+            scrape = scrape_rea_concurrent
+        else:
+            scrape = scrape_rea
+        result = scrape(
             region=args.region,
             max_pages=args.pages,
             headless=headless
         )
-        print(json.dumps(result, indent=2))
+        write_result(result)
 
 
 if __name__ == '__main__':